@@ -0,0 +1,243 @@
+import math
+
+import numpy as np
+from numba import njit, prange
+
+# Numba rejects variable-type strings, so region / stub types are int8 codes
+REGION_A, REGION_B, REGION_C = 0, 1, 2
+STUB_NONE, STUB_OPEN, STUB_SHORT = -1, 0, 1
+
+
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _tline_input_z(z_l, z_c, cos_theta, tan_theta):
+    if abs(cos_theta) < 1e-9:
+        if abs(z_l) < 1e-9:
+            return complex(1e9, 0)
+        return z_c**2 / z_l
+    t = 1j * tan_theta
+    return z_c * (z_l + z_c * t) / (z_c + z_l * t)
+
+
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _stub_admittance(y_c, sin_theta, cos_theta, tan_theta, is_open):
+    if abs(cos_theta) < 1e-9:
+        return complex(0, 1e9) if is_open else complex(0, 0)
+    if abs(sin_theta) < 1e-9:
+        return complex(0, 0) if is_open else complex(0, -1e9)
+    if is_open:
+        return 1j * y_c * tan_theta
+    else:
+        return -1j * y_c / tan_theta
+
+
+@njit(cache=True)
+def _pi_trig(f1, f2):
+    """
+    sin / cos / tan of p1*pi and p2*pi (rows f1, f2), shared by every candidate of a scan
+    """
+    out = np.empty((2, 3))
+    for i in range(2):
+        theta = math.pi * (f1 if i == 0 else f2) / (f1 + f2)
+        out[i, 0] = math.sin(theta)
+        out[i, 1] = math.cos(theta)
+        out[i, 2] = math.tan(theta)
+    return out
+
+
+@njit(cache=True)
+def _sweep_tan(n, step_rad, reseed_every=5):
+    """
+    tan(i * step_rad) for i in range(n) using the angle-addition recurrence
+    sin(a + d) = sin a cos d + cos a sin d, cos(a + d) = cos a cos d - sin a sin d.
+    Re-seeded from math.sin / math.cos every reseed_every steps to stop drift
+    """
+    sin_d = math.sin(step_rad)
+    cos_d = math.cos(step_rad)
+    out = np.empty(n)
+    s = 0.0
+    c = 1.0
+    for i in range(n):
+        if i % reseed_every == 0:
+            s = math.sin(i * step_rad)
+            c = math.cos(i * step_rad)
+        out[i] = s / c
+        s, c = s * cos_d + c * sin_d, c * cos_d - s * sin_d
+    return out
+
+
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _candidate_pipeline(f1, f2, ZL1, ZL2, Z0, theta_aux_deg, k, allow_aux_stub, pi_trig,
+                        tan_aux_p1, tan_aux_p2):
+    """
+    Run a single (theta_aux, k) candidate through all design stages.
+    pi_trig is the _pi_trig(f1, f2) table, tan_aux_p1 / tan_aux_p2 are
+    tan(theta_aux * p1) / tan(theta_aux * p2) from the scan's lookup table.
+    Mirrors DualBandMatchingDesign, returns
+    (valid, region_code, Z_aux, theta_aux_deg, Z1, theta1_deg, Z_series, Z_stub,
+     stub_type_code, aux_stub_type_code, aux_stub_Z, vswr_f1, vswr_f2)
+    """
+    p1 = f1 / (f1 + f2)
+    p2 = f2 / (f1 + f2)
+    invalid = (False, np.int8(REGION_A), 0.0, theta_aux_deg, 0.0, 0.0, 0.0, 0.0,
+               np.int8(STUB_OPEN), np.int8(STUB_NONE), 0.0, 0.0, 0.0)
+
+    # Aux line at the load
+    Z_aux = 0.0
+    theta_aux = math.radians(theta_aux_deg)
+    Z_L1 = ZL1
+    Z_L2 = ZL2
+    if theta_aux_deg > 0:
+        Z_aux = 50.0
+        Z_L1 = Z_aux * (ZL1 + 1j * Z_aux * tan_aux_p1) / (Z_aux + 1j * ZL1 * tan_aux_p1)
+        Z_L2 = Z_aux * (ZL2 + 1j * Z_aux * tan_aux_p2) / (Z_aux + 1j * ZL2 * tan_aux_p2)
+
+    # Stage 1: Conjugate Transform TL1
+    R_L1, X_L1 = Z_L1.real, Z_L1.imag
+    R_L2, X_L2 = Z_L2.real, Z_L2.imag
+    if abs(R_L2 - R_L1) < 1e-6:
+        return invalid
+    term1 = R_L1 * R_L2 + X_L1 * X_L2
+    term2 = (X_L1 + X_L2) / (R_L2 - R_L1) * (R_L1 * X_L2 - R_L2 * X_L1)
+    inside_sqrt = term1 + term2
+    if inside_sqrt < 0:
+        return invalid
+    Z1 = math.sqrt(inside_sqrt)
+
+    numerator = Z1 * (R_L2 - R_L1)
+    denominator = R_L2 * X_L1 - R_L1 * X_L2
+    if abs(denominator) < 1e-9:
+        theta1 = math.pi / 2
+    else:
+        theta1 = math.atan(numerator / denominator)
+    if theta1 < 0:
+        theta1 += math.pi
+    theta1 += k * math.pi
+
+    t = math.tan(theta1 * p1)
+    Z_in1 = Z1 * (Z_L1 + 1j * Z1 * t) / (Z1 + 1j * Z_L1 * t)
+
+    # Stage 2: Smith Chart region, aux stub for Case [c]
+    Y_in1 = 1.0 / Z_in1
+    Z_in_matched = Z_in1
+    aux_stub_type = STUB_NONE
+    aux_stub_Y2 = 0.0
+    if Z_in1.real / Z0 > 1:
+        region = REGION_A
+    elif Y_in1.real * Z0 > 1:
+        region = REGION_B
+    else:
+        region = REGION_C
+        if allow_aux_stub:
+            target_B_stub = -Y_in1.imag
+            tan_theta = pi_trig[0, 2]
+            Y2_open = target_B_stub / tan_theta if abs(tan_theta) > 1e-9 else 0.0
+            Y2_short = -target_B_stub * tan_theta
+            if Y2_open > 0:
+                aux_stub_type = STUB_OPEN
+                aux_stub_Y2 = Y2_open
+                Y_stub = 1j * Y2_open * tan_theta
+            elif Y2_short > 0:
+                aux_stub_type = STUB_SHORT
+                aux_stub_Y2 = Y2_short
+                Y_stub = -1j * Y2_short / tan_theta
+            else:
+                aux_stub_type = STUB_OPEN
+                aux_stub_Y2 = 0.02
+                Y_stub = 0j
+            Z_in_matched = 1.0 / (Y_in1 + Y_stub)
+            region = REGION_A
+
+    # Stage 3: Pi-network parameters
+    R_in1 = Z_in_matched.real
+    X_in1 = Z_in_matched.imag
+    term_sqrt = (X_in1**2 * Z0) / (R_in1 - Z0) + R_in1 * Z0
+    if term_sqrt < 0:
+        return invalid
+    Z_T1 = math.sqrt(term_sqrt)
+    num = Z_T1 * (Z0 - R_in1)
+    den = X_in1 * Z0
+    if abs(den) < 1e-9:
+        theta_T1 = math.pi / 2
+    else:
+        theta_T1 = math.atan(num / den)
+    if theta_T1 <= 0:
+        theta_T1 += math.pi
+
+    # Stage 4: Pi-network components
+    # theta_m1 = theta_n1 = p1 * pi
+    sin_p1pi, cos_p1pi, tan_theta = pi_trig[0, 0], pi_trig[0, 1], pi_trig[0, 2]
+    Z_m = (Z_T1 * math.sin(theta_T1)) / sin_p1pi
+    B_n1 = (cos_p1pi - math.cos(theta_T1)) / (Z_m * sin_p1pi)
+    Y_open = B_n1 / tan_theta if abs(tan_theta) > 1e-9 else 0.0
+    Y_short = -B_n1 * tan_theta
+    if Y_open > 0:
+        stub_type = STUB_OPEN
+        Y_n = Y_open
+    elif Y_short > 0:
+        stub_type = STUB_SHORT
+        Y_n = Y_short
+    else:
+        stub_type = STUB_OPEN
+        Y_n = Y_open if Y_open != 0 else 0.02
+
+    # VSWR at f1 and f2
+    vswr_f1 = 0.0
+    vswr_f2 = 0.0
+    for i in range(2):
+        scale = p1 if i == 0 else p2
+        current_z = ZL1 if i == 0 else ZL2
+        if Z_aux != 0:
+            current_z = _tline_input_z(current_z, Z_aux, math.cos(theta_aux * scale), math.tan(theta_aux * scale))
+        current_z = _tline_input_z(current_z, Z1, math.cos(theta1 * scale), math.tan(theta1 * scale))
+        sin_pi, cos_pi, tan_pi = pi_trig[i, 0], pi_trig[i, 1], pi_trig[i, 2]
+        # Shunt stages add up in the admittance domain
+        current_y = 1.0 / current_z
+        if aux_stub_type != STUB_NONE:
+            current_y += _stub_admittance(aux_stub_Y2, sin_pi, cos_pi, tan_pi, aux_stub_type == STUB_OPEN)
+        y_pi_stub = _stub_admittance(Y_n, sin_pi, cos_pi, tan_pi, stub_type == STUB_OPEN)
+        current_y += y_pi_stub
+        current_z = _tline_input_z(1.0 / current_y, Z_m, cos_pi, tan_pi)
+        current_z = 1.0 / (1.0/current_z + y_pi_stub)
+        rho = abs((current_z - Z0) / (current_z + Z0))
+        if i == 0:
+            vswr_f1 = (1 + rho) / (1 - rho)
+        else:
+            vswr_f2 = (1 + rho) / (1 - rho)
+
+    aux_stub_Z = 1.0 / aux_stub_Y2 if aux_stub_Y2 != 0 else 0.0
+    return (True, np.int8(region), Z_aux, theta_aux_deg, Z1, math.degrees(theta1), Z_m, 1.0 / Y_n,
+            np.int8(stub_type), np.int8(aux_stub_type), aux_stub_Z, vswr_f1, vswr_f2)
+
+
+@njit(parallel=True, cache=True)
+def _scan(f1, f2, ZL1, ZL2, Z0, theta_aux_arr, tan_aux_p1, tan_aux_p2, allow_aux_stub):
+    """
+    Evaluate every (theta_aux, k) candidate, k in [0, 1], into preallocated column arrays.
+    tan_aux_p1 / tan_aux_p2 are the aux line tan tables, one entry per theta_aux.
+    Candidates are independent, so the grid is split across threads
+    """
+    n = theta_aux_arr.size * 2
+    pi_trig = _pi_trig(f1, f2)
+    valid = np.zeros(n, dtype=np.bool_)
+    region = np.zeros(n, dtype=np.int8)
+    stub_type = np.zeros(n, dtype=np.int8)
+    aux_stub_type = np.zeros(n, dtype=np.int8)
+    values = np.zeros((9, n))
+    for i in prange(n):
+        j = i // 2
+        res = _candidate_pipeline(f1, f2, ZL1, ZL2, Z0, theta_aux_arr[j], i % 2, allow_aux_stub, pi_trig,
+                                  tan_aux_p1[j], tan_aux_p2[j])
+        valid[i] = res[0]
+        region[i] = res[1]
+        values[0, i] = res[2]
+        values[1, i] = res[3]
+        values[2, i] = res[4]
+        values[3, i] = res[5]
+        values[4, i] = res[6]
+        values[5, i] = res[7]
+        stub_type[i] = res[8]
+        aux_stub_type[i] = res[9]
+        values[6, i] = res[10]
+        values[7, i] = res[11]
+        values[8, i] = res[12]
+    return valid, region, stub_type, aux_stub_type, values
@@ -0,0 +1,221 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# Ahead-of-time compiled design scan, build with `python setup.py build_ext --inplace`.
+# Same stages and return value as core._kernels._scan, without the JIT warmup
+import numpy as np
+from libc.math cimport sin, cos, tan, atan, sqrt, fabs, M_PI
+
+# Region / stub type codes, shared with core._kernels
+cdef int REGION_A = 0, REGION_B = 1, REGION_C = 2
+cdef int STUB_NONE = -1, STUB_OPEN = 0, STUB_SHORT = 1
+
+
+cdef inline double cabs(double complex z) noexcept nogil:
+    return sqrt(z.real * z.real + z.imag * z.imag)
+
+
+cdef inline double complex tline_input_z(double complex z_l, double z_c, double cos_theta, double tan_theta) noexcept nogil:
+    cdef double complex t
+    if fabs(cos_theta) < 1e-9:
+        if cabs(z_l) < 1e-9:
+            return 1e9
+        return z_c * z_c / z_l
+    t = 1j * tan_theta
+    return z_c * (z_l + z_c * t) / (z_c + z_l * t)
+
+
+cdef inline double complex stub_admittance(double y_c, double sin_theta, double cos_theta, double tan_theta, bint is_open) noexcept nogil:
+    if fabs(cos_theta) < 1e-9:
+        return 1e9j if is_open else 0
+    if fabs(sin_theta) < 1e-9:
+        return 0 if is_open else -1e9j
+    if is_open:
+        return 1j * y_c * tan_theta
+    else:
+        return -1j * y_c / tan_theta
+
+
+cdef bint candidate_pipeline(double p1, double p2, double complex ZL1, double complex ZL2, double Z0,
+                             double theta_aux_deg, int k, bint allow_aux_stub, const double *pi_trig,
+                             double tan_aux_p1, double tan_aux_p2, signed char *codes, double *values) noexcept nogil:
+    """
+    Run a single (theta_aux, k) candidate through all design stages.
+    pi_trig holds sin / cos / tan of p1*pi then p2*pi, tan_aux_p1 / tan_aux_p2 are
+    tan(theta_aux * p1) / tan(theta_aux * p2). Writes
+    codes = (region, stub_type, aux_stub_type) and
+    values = (Z_aux, theta_aux_deg, Z1, theta1_deg, Z_series, Z_stub, aux_stub_Z, vswr_f1, vswr_f2),
+    returns whether the design is valid
+    """
+    cdef double sin_p1pi = pi_trig[0], cos_p1pi = pi_trig[1], tan_p1pi = pi_trig[2]
+    cdef double sin_pi, cos_pi, tan_pi, scale
+    cdef double Z_aux = 0.0, theta_aux = theta_aux_deg * M_PI / 180.0, t
+    cdef double complex Z_L1 = ZL1, Z_L2 = ZL2, Z_in1, Y_in1, Y_stub, Z_in_matched
+    cdef double complex current_z, current_y, y_pi_stub
+    cdef double R_L1, X_L1, R_L2, X_L2, inside_sqrt, Z1, numerator, denominator, theta1
+    cdef double target_B_stub, Y2_open, Y2_short, aux_stub_Y2 = 0.0
+    cdef double R_in1, X_in1, term_sqrt, Z_T1, num, den, theta_T1
+    cdef double Z_m, B_n1, Y_open, Y_short, Y_n, rho
+    cdef int region, stub_type, aux_stub_type = STUB_NONE, i
+
+    # Invalid candidates keep the same placeholder row as core._kernels
+    codes[0], codes[1], codes[2] = REGION_A, STUB_OPEN, STUB_NONE
+    for i in range(9):
+        values[i] = 0.0
+    values[1] = theta_aux_deg
+
+    # Aux line at the load
+    if theta_aux_deg > 0:
+        Z_aux = 50.0
+        Z_L1 = Z_aux * (ZL1 + 1j * Z_aux * tan_aux_p1) / (Z_aux + 1j * ZL1 * tan_aux_p1)
+        Z_L2 = Z_aux * (ZL2 + 1j * Z_aux * tan_aux_p2) / (Z_aux + 1j * ZL2 * tan_aux_p2)
+
+    # Stage 1: Conjugate Transform TL1
+    R_L1, X_L1 = Z_L1.real, Z_L1.imag
+    R_L2, X_L2 = Z_L2.real, Z_L2.imag
+    if fabs(R_L2 - R_L1) < 1e-6:
+        return False
+    inside_sqrt = R_L1 * R_L2 + X_L1 * X_L2 + (X_L1 + X_L2) / (R_L2 - R_L1) * (R_L1 * X_L2 - R_L2 * X_L1)
+    if inside_sqrt < 0:
+        return False
+    Z1 = sqrt(inside_sqrt)
+
+    numerator = Z1 * (R_L2 - R_L1)
+    denominator = R_L2 * X_L1 - R_L1 * X_L2
+    if fabs(denominator) < 1e-9:
+        theta1 = M_PI / 2
+    else:
+        theta1 = atan(numerator / denominator)
+    if theta1 < 0:
+        theta1 += M_PI
+    theta1 += k * M_PI
+
+    t = tan(theta1 * p1)
+    Z_in1 = Z1 * (Z_L1 + 1j * Z1 * t) / (Z1 + 1j * Z_L1 * t)
+
+    # Stage 2: Smith Chart region, aux stub for Case [c]
+    Y_in1 = 1.0 / Z_in1
+    Z_in_matched = Z_in1
+    if Z_in1.real / Z0 > 1:
+        region = REGION_A
+    elif Y_in1.real * Z0 > 1:
+        region = REGION_B
+    else:
+        region = REGION_C
+        if allow_aux_stub:
+            target_B_stub = -Y_in1.imag
+            Y2_open = target_B_stub / tan_p1pi if fabs(tan_p1pi) > 1e-9 else 0.0
+            Y2_short = -target_B_stub * tan_p1pi
+            if Y2_open > 0:
+                aux_stub_type = STUB_OPEN
+                aux_stub_Y2 = Y2_open
+                Y_stub = 1j * Y2_open * tan_p1pi
+            elif Y2_short > 0:
+                aux_stub_type = STUB_SHORT
+                aux_stub_Y2 = Y2_short
+                Y_stub = -1j * Y2_short / tan_p1pi
+            else:
+                aux_stub_type = STUB_OPEN
+                aux_stub_Y2 = 0.02
+                Y_stub = 0
+            Z_in_matched = 1.0 / (Y_in1 + Y_stub)
+            region = REGION_A
+
+    # Stage 3: Pi-network parameters
+    R_in1 = Z_in_matched.real
+    X_in1 = Z_in_matched.imag
+    term_sqrt = (X_in1 * X_in1 * Z0) / (R_in1 - Z0) + R_in1 * Z0
+    if term_sqrt < 0:
+        return False
+    Z_T1 = sqrt(term_sqrt)
+    num = Z_T1 * (Z0 - R_in1)
+    den = X_in1 * Z0
+    if fabs(den) < 1e-9:
+        theta_T1 = M_PI / 2
+    else:
+        theta_T1 = atan(num / den)
+    if theta_T1 <= 0:
+        theta_T1 += M_PI
+
+    # Stage 4: Pi-network components, theta_m1 = theta_n1 = p1 * pi
+    Z_m = (Z_T1 * sin(theta_T1)) / sin_p1pi
+    B_n1 = (cos_p1pi - cos(theta_T1)) / (Z_m * sin_p1pi)
+    Y_open = B_n1 / tan_p1pi if fabs(tan_p1pi) > 1e-9 else 0.0
+    Y_short = -B_n1 * tan_p1pi
+    if Y_open > 0:
+        stub_type = STUB_OPEN
+        Y_n = Y_open
+    elif Y_short > 0:
+        stub_type = STUB_SHORT
+        Y_n = Y_short
+    else:
+        stub_type = STUB_OPEN
+        Y_n = Y_open if Y_open != 0 else 0.02
+
+    # VSWR at f1 and f2
+    for i in range(2):
+        scale = p1 if i == 0 else p2
+        current_z = ZL1 if i == 0 else ZL2
+        if Z_aux != 0:
+            current_z = tline_input_z(current_z, Z_aux, cos(theta_aux * scale), tan(theta_aux * scale))
+        current_z = tline_input_z(current_z, Z1, cos(theta1 * scale), tan(theta1 * scale))
+        sin_pi, cos_pi, tan_pi = pi_trig[3 * i], pi_trig[3 * i + 1], pi_trig[3 * i + 2]
+        # Shunt stages add up in the admittance domain
+        current_y = 1.0 / current_z
+        if aux_stub_type != STUB_NONE:
+            current_y += stub_admittance(aux_stub_Y2, sin_pi, cos_pi, tan_pi, aux_stub_type == STUB_OPEN)
+        y_pi_stub = stub_admittance(Y_n, sin_pi, cos_pi, tan_pi, stub_type == STUB_OPEN)
+        current_y += y_pi_stub
+        current_z = tline_input_z(1.0 / current_y, Z_m, cos_pi, tan_pi)
+        current_z = 1.0 / (1.0 / current_z + y_pi_stub)
+        rho = cabs((current_z - Z0) / (current_z + Z0))
+        values[7 + i] = (1 + rho) / (1 - rho)
+
+    codes[0], codes[1], codes[2] = region, stub_type, aux_stub_type
+    values[0], values[2], values[3] = Z_aux, Z1, theta1 * 180.0 / M_PI
+    values[4], values[5] = Z_m, 1.0 / Y_n
+    values[6] = 1.0 / aux_stub_Y2 if aux_stub_Y2 != 0 else 0.0
+    return True
+
+
+cpdef tuple scan(double f1, double f2, double complex ZL1, double complex ZL2, double Z0,
+                 const double[::1] theta_aux_arr, bint allow_aux_stub):
+    """
+    Evaluate every (theta_aux, k) candidate, k in [0, 1], into preallocated column arrays.
+    Returns (valid, region, stub_type, aux_stub_type, values(9, n)) like core._kernels._scan
+    """
+    cdef Py_ssize_t n = theta_aux_arr.shape[0] * 2, i, j
+    cdef double p1 = f1 / (f1 + f2)
+    cdef double p2 = f2 / (f1 + f2)
+    cdef double theta, theta_aux, tan_aux_p1 = 0.0, tan_aux_p2 = 0.0
+    cdef int k
+    cdef double pi_trig[6]
+    cdef signed char codes[3]
+    cdef double cand_values[9]
+
+    valid = np.zeros(n, dtype=np.uint8)
+    region = np.zeros(n, dtype=np.int8)
+    stub_type = np.zeros(n, dtype=np.int8)
+    aux_stub_type = np.zeros(n, dtype=np.int8)
+    values = np.zeros((9, n))
+    cdef unsigned char[::1] valid_v = valid
+    cdef signed char[::1] region_v = region, stub_type_v = stub_type, aux_stub_type_v = aux_stub_type
+    cdef double[:, ::1] values_v = values
+
+    # Stubs and the Pi-network series line are p1*pi / p2*pi long, shared by every candidate
+    for i in range(2):
+        theta = M_PI * (p1 if i == 0 else p2)
+        pi_trig[3 * i], pi_trig[3 * i + 1], pi_trig[3 * i + 2] = sin(theta), cos(theta), tan(theta)
+
+    with nogil:
+        for i in range(n):
+            j = i // 2
+            theta_aux = theta_aux_arr[j]
+            if i % 2 == 0:
+                # Both k of a theta_aux share the aux line tan values
+                tan_aux_p1 = tan(theta_aux * M_PI / 180.0 * p1)
+                tan_aux_p2 = tan(theta_aux * M_PI / 180.0 * p2)
+            valid_v[i] = candidate_pipeline(p1, p2, ZL1, ZL2, Z0, theta_aux, i % 2, allow_aux_stub, pi_trig,
+                                            tan_aux_p1, tan_aux_p2, codes, cand_values)
+            region_v[i], stub_type_v[i], aux_stub_type_v[i] = codes[0], codes[1], codes[2]
+            for k in range(9):
+                values_v[k, i] = cand_values[k]
+    return valid.view(np.bool_), region, stub_type, aux_stub_type, values
@@ -1,7 +1,30 @@
-import numpy as np
+import math
 import cmath
 
+import numpy as np
+
+try:
+    # Optional compiled extension, see setup.py
+    from . import _matcher_kernel
+except ImportError:
+    _matcher_kernel = None
+
+_kernels = None
+if _matcher_kernel is None:
+    try:
+        from . import _kernels
+    except ImportError:
+        # Numba is optional, find_all_designs falls back to the NumPy scan
+        _kernels = None
+
 class DualBandMatchingDesign:
+    # No per-instance __dict__, attribute reads go through slot descriptors
+    __slots__ = ('f1', 'f2', 'Z_L1_orig', 'Z_L2_orig', 'Z_L1', 'Z_L2', 'Z0', 'p1', 'p2',
+                 '_sin_p1pi', '_cos_p1pi', '_tan_p1pi', '_sin_p2pi', '_cos_p2pi', '_tan_p2pi',
+                 'aux_line_Z', 'aux_line_theta', 'Z1', 'theta1', 'Z_in1', 'Z_in_matched', '_y_in1',
+                 'region', 'aux_stub_type', 'aux_stub_Y2', 'Z_T1', 'theta_T1', 'Z_m', 'stub_type',
+                 'Z_n', 'Y_n')
+
     def __init__(self, f1, f2, Z_L1, Z_L2, Z0=50.0):
         """
         Initialize Dual Band Matching Design
@@ -23,6 +46,15 @@ class DualBandMatchingDesign:
         self.p1 = f1 / (f1 + f2)
         self.p2 = f2 / (f1 + f2)
         
+        # Stubs and the Pi-network series line are 180 deg at f1+f2,
+        # i.e. p1*pi / p2*pi at f1 / f2, so their trig is constant per design
+        self._sin_p1pi = math.sin(self.p1 * math.pi)
+        self._cos_p1pi = math.cos(self.p1 * math.pi)
+        self._tan_p1pi = math.tan(self.p1 * math.pi)
+        self._sin_p2pi = math.sin(self.p2 * math.pi)
+        self._cos_p2pi = math.cos(self.p2 * math.pi)
+        self._tan_p2pi = math.tan(self.p2 * math.pi)
+        
         # State variables
         self.aux_line_Z = None
         self.aux_line_theta = None
@@ -37,6 +69,7 @@ class DualBandMatchingDesign:
         self.stub_type = None
         self.Z_n = None
         self.Y_n = None
+        self._y_in1 = None
 
     def apply_aux_line(self, Z_p, theta_deg):
         """
@@ -44,18 +77,18 @@ class DualBandMatchingDesign:
         :param Z_p: Characteristic impedance of aux line
         :param theta_deg: Electrical length in degrees (at f1+f2)
         """
-        theta_rad = np.radians(theta_deg)
-        theta_p1 = theta_rad * self.p1
-        theta_p2 = theta_rad * self.p2
+        theta_rad = math.radians(theta_deg)
         
         # Transmission line transformation
         # Z_in = Z0 * (ZL + j Z0 tan(theta)) / (Z0 + j ZL tan(theta))
-        num1 = self.Z_L1_orig + 1j * Z_p * np.tan(theta_p1)
-        den1 = Z_p + 1j * self.Z_L1_orig * np.tan(theta_p1)
+        tan_p1 = math.tan(theta_rad * self.p1)
+        num1 = self.Z_L1_orig + 1j * Z_p * tan_p1
+        den1 = Z_p + 1j * self.Z_L1_orig * tan_p1
         Z_L1_new = Z_p * num1 / den1
         
-        num2 = self.Z_L2_orig + 1j * Z_p * np.tan(theta_p2)
-        den2 = Z_p + 1j * self.Z_L2_orig * np.tan(theta_p2)
+        tan_p2 = math.tan(theta_rad * self.p2)
+        num2 = self.Z_L2_orig + 1j * Z_p * tan_p2
+        den2 = Z_p + 1j * self.Z_L2_orig * tan_p2
         Z_L2_new = Z_p * num2 / den2
         
         self.Z_L1 = Z_L1_new
@@ -80,25 +113,26 @@ class DualBandMatchingDesign:
         if inside_sqrt < 0:
             return False 
             
-        self.Z1 = np.sqrt(inside_sqrt)
+        self.Z1 = math.sqrt(inside_sqrt)
         
         numerator = self.Z1 * (R_L2 - R_L1)
         denominator = R_L2 * X_L1 - R_L1 * X_L2
         
         # Avoid division by zero
         if abs(denominator) < 1e-9:
-            theta1_rad = np.pi / 2
+            theta1_rad = math.pi / 2
         else:
-            theta1_rad = np.arctan(numerator / denominator)
+            theta1_rad = math.atan(numerator / denominator)
         
         if theta1_rad < 0:
-            theta1_rad += np.pi
+            theta1_rad += math.pi
             
-        self.theta1 = theta1_rad + additional_pi * np.pi
+        self.theta1 = theta1_rad + additional_pi * math.pi
         
         # Calculate Z_in1 for next stage
         theta1_f1 = self.theta1 * self.p1
-        self.Z_in1 = self.Z1 * (self.Z_L1 + 1j * self.Z1 * np.tan(theta1_f1)) / (self.Z1 + 1j * self.Z_L1 * np.tan(theta1_f1))
+        tan_theta1_f1 = math.tan(theta1_f1)
+        self.Z_in1 = self.Z1 * (self.Z_L1 + 1j * self.Z1 * tan_theta1_f1) / (self.Z1 + 1j * self.Z_L1 * tan_theta1_f1)
         
         return True
 
@@ -106,9 +140,10 @@ class DualBandMatchingDesign:
         """
         Stage 2: Check Smith Chart region and add aux stub if needed (Case c)
         """
-        z_norm = self.Z_in1 / self.Z0
-        r = z_norm.real
-        g = (1/z_norm).real
+        # Y_in1 is needed for g and again by the aux stub, take the reciprocal once
+        self._y_in1 = 1.0 / self.Z_in1
+        r = self.Z_in1.real / self.Z0
+        g = self._y_in1.real * self.Z0
         
         self.Z_in_matched = self.Z_in1
         
@@ -125,14 +160,13 @@ class DualBandMatchingDesign:
         """
         Handle Case [c] by adding parallel auxiliary stub
         """
-        Y_in1 = 1.0 / self.Z_in1
+        Y_in1 = self._y_in1
         G_in1 = Y_in1.real
         B_in1 = Y_in1.imag
         
         # Target B_stub = -B_in1 to make Z_in real
         target_B_stub = -B_in1
-        theta_stub_f1 = self.p1 * np.pi
-        tan_theta = np.tan(theta_stub_f1)
+        tan_theta = self._tan_p1pi
         
         # Try Open Stub
         Y2_open = target_B_stub / tan_theta if abs(tan_theta) > 1e-9 else 0
@@ -171,18 +205,18 @@ class DualBandMatchingDesign:
         if term_sqrt < 0:
             return False
             
-        self.Z_T1 = np.sqrt(term_sqrt)
+        self.Z_T1 = math.sqrt(term_sqrt)
         
         num = self.Z_T1 * (Z_S - R_in1)
         den = X_in1 * Z_S
         
         if abs(den) < 1e-9:
-             theta_T1_rad = np.pi/2
+             theta_T1_rad = math.pi/2
         else:
-             theta_T1_rad = np.arctan(num / den)
+             theta_T1_rad = math.atan(num / den)
         
         if theta_T1_rad <= 0:
-            theta_T1_rad += np.pi
+            theta_T1_rad += math.pi
             
         self.theta_T1 = theta_T1_rad
         return True
@@ -191,13 +225,12 @@ class DualBandMatchingDesign:
         """
         Stage 4: Synthesize Pi-network components
         """
-        theta_m1 = self.p1 * np.pi
-        self.Z_m = (self.Z_T1 * np.sin(self.theta_T1)) / np.sin(theta_m1)
+        # theta_m1 = theta_n1 = p1 * pi
+        self.Z_m = (self.Z_T1 * math.sin(self.theta_T1)) / self._sin_p1pi
         
-        theta_n1 = self.p1 * np.pi
-        B_n1 = (np.cos(theta_n1) - np.cos(self.theta_T1)) / (self.Z_m * np.sin(theta_n1))
+        B_n1 = (self._cos_p1pi - math.cos(self.theta_T1)) / (self.Z_m * self._sin_p1pi)
         
-        tan_theta = np.tan(theta_n1)
+        tan_theta = self._tan_p1pi
         
         Y_open = B_n1 / tan_theta if abs(tan_theta) > 1e-9 else 0
         Y_short = -B_n1 * tan_theta
@@ -225,9 +258,9 @@ class DualBandMatchingDesign:
             "f_design": f_design,
             "region": self.region,
             "Z_aux": self.aux_line_Z if self.aux_line_Z else 0,
-            "theta_aux": np.degrees(self.aux_line_theta) if self.aux_line_theta else 0,
+            "theta_aux": math.degrees(self.aux_line_theta) if self.aux_line_theta else 0,
             "Z1": self.Z1,
-            "theta1": np.degrees(self.theta1),
+            "theta1": math.degrees(self.theta1),
             "Z_series": self.Z_m,
             "Z_stub": self.Z_n,
             "stub_type": self.stub_type,
@@ -240,98 +273,399 @@ class DualBandMatchingDesign:
         """
         Calculate VSWR at f1 and f2
         """
-        def tline_input_z(z_l, z_c, theta_rad):
-            if abs(np.cos(theta_rad)) < 1e-9:
-                if abs(z_l) < 1e-9: return complex(1e9, 0)
-                return z_c**2 / z_l
-            t = 1j * np.tan(theta_rad)
-            return z_c * (z_l + z_c * t) / (z_c + z_l * t)
-
-        def stub_admittance(y_c, theta_rad, is_open):
-            if abs(np.cos(theta_rad)) < 1e-9:
-                return complex(0, 1e9) if is_open else 0
-            if abs(np.sin(theta_rad)) < 1e-9:
-                return 0 if is_open else complex(0, -1e9)
-            if is_open:
-                return 1j * y_c * np.tan(theta_rad)
-            else:
-                return -1j * y_c / np.tan(theta_rad)
-
+        # 0./1. Aux Line and TL1 are not part of the cascade. At f1 their output is
+        # Z_in1 from calculate_conjugate_transform, at f2 both are applied afresh
+        # to the original load
+        z_l2 = self.Z_L2_orig
+        if self.aux_line_Z:
+            tan_aux_f2 = math.tan(self.aux_line_theta * self.p2)
+            z_l2 = self.aux_line_Z * (z_l2 + 1j * self.aux_line_Z * tan_aux_f2) / (self.aux_line_Z + 1j * z_l2 * tan_aux_f2)
+        tan_theta1_f2 = math.tan(self.theta1 * self.p2)
+        z_tl1_f2 = self.Z1 * (z_l2 + 1j * self.Z1 * tan_theta1_f2) / (self.Z1 + 1j * z_l2 * tan_theta1_f2)
+        
         results = {}
-        for f, z_l_orig in [(self.f1, self.Z_L1_orig), (self.f2, self.Z_L2_orig)]:
-            scale = f / (self.f1 + self.f2)
-            
-            # 0. Aux Line
-            current_z = z_l_orig
-            if self.aux_line_Z:
-                theta_aux_f = self.aux_line_theta * scale
-                current_z = tline_input_z(current_z, self.aux_line_Z, theta_aux_f)
+        for f, z_tl1, sin_pi, cos_pi, tan_pi in [
+            (self.f1, self.Z_in1, self._sin_p1pi, self._cos_p1pi, self._tan_p1pi),
+            (self.f2, z_tl1_f2, self._sin_p2pi, self._cos_p2pi, self._tan_p2pi),
+        ]:
+            quarter_wave = abs(cos_pi) < 1e-9
+            half_wave = abs(sin_pi) < 1e-9
             
-            # 1. TL1
-            theta1_f = self.theta1 * scale
-            current_z = tline_input_z(current_z, self.Z1, theta1_f)
+            # Every stage is a 2x2 ABCD matrix, the cascade collapses to one matrix
+            # and a single bilinear transform of the TL1 output. Cascade from the
+            # TL1 output towards the source, starting from the identity.
+            # Line: [[c, jZ s], [j s/Z, c]] @ M, shunt: [[1, 0], [Y, 1]] @ M
+            A, B, C, D = 1, 0, 0, 1
             
-            # 2. Aux Stub (Case c)
+            # 2. Aux Stub (Case c), 180 deg at f1+f2
             if self.aux_stub_type:
-                theta_stub = np.pi * scale
-                y_stub = stub_admittance(self.aux_stub_Y2, theta_stub, self.aux_stub_type == 'Open')
-                current_z = 1.0 / (1.0/current_z + y_stub)
+                is_open = self.aux_stub_type == 'Open'
+                if quarter_wave:
+                    y_stub = complex(0, 1e9) if is_open else 0
+                elif half_wave:
+                    y_stub = 0 if is_open else complex(0, -1e9)
+                elif is_open:
+                    y_stub = 1j * self.aux_stub_Y2 * tan_pi
+                else:
+                    y_stub = -1j * self.aux_stub_Y2 / tan_pi
+                C, D = C + y_stub * A, D + y_stub * B
             
-            # 3. Pi Network
-            theta_pi = np.pi * scale
-            y_pi_stub = stub_admittance(self.Y_n, theta_pi, self.stub_type == 'Open')
+            # 3. Pi Network, 180 deg at f1+f2
+            is_open = self.stub_type == 'Open'
+            if quarter_wave:
+                y_pi_stub = complex(0, 1e9) if is_open else 0
+            elif half_wave:
+                y_pi_stub = 0 if is_open else complex(0, -1e9)
+            elif is_open:
+                y_pi_stub = 1j * self.Y_n * tan_pi
+            else:
+                y_pi_stub = -1j * self.Y_n / tan_pi
             
             # Shunt 1
-            current_z = 1.0 / (1.0/current_z + y_pi_stub)
+            C, D = C + y_pi_stub * A, D + y_pi_stub * B
             # Series
-            current_z = tline_input_z(current_z, self.Z_m, theta_pi)
+            jzs, jsz = 1j * self.Z_m * sin_pi, 1j * sin_pi / self.Z_m
+            A, B, C, D = cos_pi * A + jzs * C, cos_pi * B + jzs * D, jsz * A + cos_pi * C, jsz * B + cos_pi * D
             # Shunt 2
-            current_z = 1.0 / (1.0/current_z + y_pi_stub)
+            C, D = C + y_pi_stub * A, D + y_pi_stub * B
             
-            rho = (current_z - self.Z0) / (current_z + self.Z0)
-            vswr = (1 + abs(rho)) / (1 - abs(rho))
-            results[f] = vswr
+            z_in = (A * z_tl1 + B) / (C * z_tl1 + D)
+            rho = abs((z_in - self.Z0) / (z_in + self.Z0))
+            # |rho| = 1 when a quarter-wave stub shorts the line (f1 == f2), VSWR is infinite
+            results[f] = (1 + rho) / (1 - rho) if rho != 1 else math.inf
             
         return results
 
-def find_all_designs(f1, f2, Z_L1, Z_L2, Z0=50.0, allow_aux_stub=True, scan_load_aux_line=True):
+def _tline_input_z_soa(R_L, X_L, Z_c, tan_theta):
+    """
+    Z_c * (Z_L + j Z_c tan) / (Z_c + j Z_L tan) on separate real / imaginary parts,
+    using (a + jb) / (c + jd) = ((ac + bd) + j(bc - ad)) / (c^2 + d^2)
+    """
+    a = R_L
+    b = X_L + Z_c * tan_theta
+    c = Z_c - X_L * tan_theta
+    d = R_L * tan_theta
+    scale = Z_c / (c * c + d * d)
+    return scale * (a * c + b * d), scale * (b * c - a * d)
+
+def _apply_aux_line_vec(R_L1, X_L1, R_L2, X_L2, Z_p, theta_rad, tan_p1, tan_p2):
+    """
+    Vectorized apply_aux_line over an array of aux line lengths,
+    tan_p1 / tan_p2 are tan(theta_rad * p1) / tan(theta_rad * p2)
+    """
+    R_L1_new, X_L1_new = _tline_input_z_soa(R_L1, X_L1, Z_p, tan_p1)
+    R_L2_new, X_L2_new = _tline_input_z_soa(R_L2, X_L2, Z_p, tan_p2)
+    
+    # theta = 0 means no aux line at all
+    has_aux = theta_rad > 0
+    return (np.where(has_aux, R_L1_new, R_L1), np.where(has_aux, X_L1_new, X_L1),
+            np.where(has_aux, R_L2_new, R_L2), np.where(has_aux, X_L2_new, X_L2))
+
+def _calculate_conjugate_transform_vec(R_L1, X_L1, R_L2, X_L2, additional_pi, p1):
     """
-    Exhaustive search for valid designs
+    Vectorized calculate_conjugate_transform, returns a validity mask instead of False
     """
-    candidates = []
+    term1 = R_L1 * R_L2 + X_L1 * X_L2
+    term2 = (X_L1 + X_L2) / (R_L2 - R_L1) * (R_L1 * X_L2 - R_L2 * X_L1)
+    inside_sqrt = term1 + term2
+    
+    valid = (np.abs(R_L2 - R_L1) >= 1e-6) & (inside_sqrt >= 0)
+    Z1 = np.sqrt(np.where(valid, inside_sqrt, 0.0))
+    
+    numerator = Z1 * (R_L2 - R_L1)
+    denominator = R_L2 * X_L1 - R_L1 * X_L2
+    theta1 = np.where(np.abs(denominator) < 1e-9, np.pi / 2, np.arctan(numerator / denominator))
+    theta1 = np.where(theta1 < 0, theta1 + np.pi, theta1)
+    theta1 = theta1 + additional_pi * np.pi
+    
+    R_in1, X_in1 = _tline_input_z_soa(R_L1, X_L1, Z1, np.tan(theta1 * p1))
+    return valid, Z1, theta1, R_in1, X_in1
+
+def _check_region_and_adjust_vec(R_in1, X_in1, Z0, p1, allow_aux_stub=True):
+    """
+    Vectorized check_region_and_adjust, regions as codes 0/1/2 = 'a'/'b'/'c'.
+    Only the Case [c] candidates go through the aux stub
+    """
+    mag2 = R_in1 * R_in1 + X_in1 * X_in1
+    G_in1 = R_in1 / mag2
+    B_in1 = -X_in1 / mag2
+    r = R_in1 / Z0
+    g = G_in1 * Z0
+    region = np.where(r > 1, 0, np.where(g > 1, 1, 2)).astype(np.int8)
+    
+    R_in_matched = R_in1.copy()
+    X_in_matched = X_in1.copy()
+    aux_stub_type = np.full(R_in1.shape, -1, dtype=np.int8)
+    aux_stub_Y2 = np.zeros(R_in1.shape)
+    
+    needs_aux_stub = (region == 2) & allow_aux_stub
+    R_in_matched[needs_aux_stub], X_in_matched[needs_aux_stub], aux_stub_type[needs_aux_stub], \
+        aux_stub_Y2[needs_aux_stub] = _add_auxiliary_stub_vec(G_in1[needs_aux_stub], B_in1[needs_aux_stub], p1)
+    region[needs_aux_stub] = 0 # Forced to a
+    return region, R_in_matched, X_in_matched, aux_stub_type, aux_stub_Y2
+
+def _add_auxiliary_stub_vec(G_in1, B_in1, p1):
+    """
+    Vectorized _add_auxiliary_stub on Y_in1 = G_in1 + j B_in1,
+    stub types as codes 0/1 = 'Open'/'Short'
+    """
+    target_B_stub = -B_in1
+    tan_theta = np.tan(p1 * np.pi)
+    
+    Y2_open = target_B_stub / tan_theta if abs(tan_theta) > 1e-9 else np.zeros_like(target_B_stub)
+    Y2_short = -target_B_stub * tan_theta
+    
+    use_open = Y2_open > 0
+    use_short = ~use_open & (Y2_short > 0)
+    aux_stub_Y2 = np.where(use_open, Y2_open, np.where(use_short, Y2_short, 0.02))
+    B_stub = np.where(use_open, Y2_open * tan_theta, np.where(use_short, -Y2_short / tan_theta, 0))
+    aux_stub_type = np.where(use_short, 1, 0)
+    
+    # The stub is a pure susceptance, Z = 1 / (G + jB)
+    B_new = B_in1 + B_stub
+    mag2 = G_in1 * G_in1 + B_new * B_new
+    return G_in1 / mag2, -B_new / mag2, aux_stub_type, aux_stub_Y2
+
+def _calculate_matching_network_vec(R_in1, X_in1, Z0):
+    """
+    Vectorized calculate_matching_network, returns a validity mask instead of False
+    """
+    Z_S = Z0
+    
+    term_sqrt = (X_in1**2 * Z_S) / (R_in1 - Z_S) + R_in1 * Z_S
+    valid = term_sqrt >= 0
+    Z_T1 = np.sqrt(np.where(valid, term_sqrt, 0.0))
+    
+    num = Z_T1 * (Z_S - R_in1)
+    den = X_in1 * Z_S
+    theta_T1 = np.where(np.abs(den) < 1e-9, np.pi / 2, np.arctan(num / den))
+    theta_T1 = np.where(theta_T1 <= 0, theta_T1 + np.pi, theta_T1)
+    return valid, Z_T1, theta_T1
+
+def _synthesize_pi_network_vec(Z_T1, theta_T1, p1):
+    """
+    Vectorized synthesize_pi_network, stub types as codes 0/1 = 'Open'/'Short'
+    """
+    theta_m1 = p1 * np.pi
+    Z_m = (Z_T1 * np.sin(theta_T1)) / np.sin(theta_m1)
+    
+    theta_n1 = p1 * np.pi
+    B_n1 = (np.cos(theta_n1) - np.cos(theta_T1)) / (Z_m * np.sin(theta_n1))
+    
+    tan_theta = np.tan(theta_n1)
+    
+    Y_open = B_n1 / tan_theta if abs(tan_theta) > 1e-9 else np.zeros_like(B_n1)
+    Y_short = -B_n1 * tan_theta
+    
+    use_open = Y_open > 0
+    use_short = ~use_open & (Y_short > 0)
+    Y_n = np.where(use_open, Y_open, np.where(use_short, Y_short, np.where(Y_open != 0, Y_open, 0.02)))
+    stub_type = np.where(use_short, 1, 0).astype(np.int8)
+    return Z_m, stub_type, 1.0 / Y_n, Y_n
+
+def _tline_input_z_vec(z_l, z_c, theta_rad):
+    quarter_wave = np.abs(np.cos(theta_rad)) < 1e-9
+    t = 1j * np.tan(theta_rad)
+    z_quarter = np.where(np.abs(z_l) < 1e-9, complex(1e9, 0), z_c**2 / z_l)
+    return np.where(quarter_wave, z_quarter, z_c * (z_l + z_c * t) / (z_c + z_l * t))
+
+def _stub_admittance_vec(y_c, theta_rad, is_open):
+    # theta_rad is shared by every candidate, only y_c and is_open vary
+    if abs(np.cos(theta_rad)) < 1e-9:
+        return np.where(is_open, complex(0, 1e9), 0)
+    if abs(np.sin(theta_rad)) < 1e-9:
+        return np.where(is_open, 0, complex(0, -1e9))
+    return np.where(is_open, 1j * y_c * np.tan(theta_rad), -1j * y_c / np.tan(theta_rad))
+
+def _verify_metrics_vec(f, f1, f2, z_l_orig, Z0, aux_line_Z, aux_line_theta, Z1, theta1,
+                        aux_stub_type, aux_stub_Y2, Z_m, stub_type, Y_n):
+    """
+    Vectorized verify_metrics for a single frequency f
+    """
+    scale = f / (f1 + f2)
+    
+    # 0. Aux Line
+    current_z = np.full(Z1.shape, z_l_orig, dtype=complex)
+    has_aux_line = aux_line_Z != 0
+    current_z = np.where(has_aux_line, _tline_input_z_vec(current_z, aux_line_Z, aux_line_theta * scale), current_z)
+    
+    # 1. TL1
+    current_z = _tline_input_z_vec(current_z, Z1, theta1 * scale)
+    
+    # Shunt stages add up in the admittance domain, only convert back for the series line
+    current_y = 1.0 / current_z
+    
+    # 2. Aux Stub (Case c)
+    has_aux_stub = aux_stub_type >= 0
+    y_stub = _stub_admittance_vec(aux_stub_Y2, np.pi * scale, aux_stub_type == 0)
+    current_y = np.where(has_aux_stub, current_y + y_stub, current_y)
+    
+    # 3. Pi Network
+    theta_pi = np.pi * scale
+    y_pi_stub = _stub_admittance_vec(Y_n, theta_pi, stub_type == 0)
+    
+    # Shunt 1
+    current_y = current_y + y_pi_stub
+    # Series
+    current_z = _tline_input_z_vec(1.0 / current_y, Z_m, theta_pi)
+    # Shunt 2
+    current_z = 1.0 / (1.0/current_z + y_pi_stub)
+    
+    rho = np.abs((current_z - Z0) / (current_z + Z0))
+    return (1 + rho) / (1 - rho)
+
+def _scan_designs_vec(f1, f2, Z_L1, Z_L2, Z0, theta_aux_range, tan_aux_p1, tan_aux_p2, allow_aux_stub):
+    """
+    NumPy scan: the whole (theta_aux, k) grid is evaluated at once as arrays.
+    tan_aux_p1 / tan_aux_p2 is the aux line tan table of find_all_designs.
+    Failing candidates are dropped after each stage that can reject them, so the
+    columns only hold the valid designs and the returned mask is all True.
+    Region / stub types are int8 codes
+    """
+    k_range = np.array([0, 1])
+    
+    # Flatten the grid in the same (theta_aux, k) order as a nested loop
+    theta_aux, k = np.meshgrid(theta_aux_range, k_range, indexing='ij')
+    theta_aux = theta_aux.ravel()
+    k = k.ravel()
+    
+    p1 = f1 / (f1 + f2)
+    p2 = f2 / (f1 + f2)
+    
+    # Rejected candidates still produce NaN/inf within a stage, before they are compacted away
+    with np.errstate(all='ignore'):
+        aux_line_theta = np.radians(theta_aux)
+        aux_line_Z = np.where(theta_aux > 0, 50.0, 0.0)
+        # Impedances are carried as separate real / imaginary float arrays
+        R_L1, X_L1, R_L2, X_L2 = _apply_aux_line_vec(
+            Z_L1.real, Z_L1.imag, Z_L2.real, Z_L2.imag, 50.0, aux_line_theta,
+            np.repeat(tan_aux_p1, k_range.size), np.repeat(tan_aux_p2, k_range.size))
+        
+        valid, Z1, theta1, R_in1, X_in1 = _calculate_conjugate_transform_vec(R_L1, X_L1, R_L2, X_L2, k, p1)
+        keep = np.flatnonzero(valid)
+        Z1, theta1, R_in1, X_in1 = Z1[keep], theta1[keep], R_in1[keep], X_in1[keep]
+        aux_line_Z, aux_line_theta = aux_line_Z[keep], aux_line_theta[keep]
+        
+        region, R_in_matched, X_in_matched, aux_stub_type, aux_stub_Y2 = _check_region_and_adjust_vec(
+            R_in1, X_in1, Z0, p1, allow_aux_stub)
+        
+        valid_network, Z_T1, theta_T1 = _calculate_matching_network_vec(R_in_matched, X_in_matched, Z0)
+        keep = np.flatnonzero(valid_network)
+        Z_T1, theta_T1, Z1, theta1 = Z_T1[keep], theta_T1[keep], Z1[keep], theta1[keep]
+        aux_line_Z, aux_line_theta = aux_line_Z[keep], aux_line_theta[keep]
+        region, aux_stub_type, aux_stub_Y2 = region[keep], aux_stub_type[keep], aux_stub_Y2[keep]
+        
+        Z_m, stub_type, Z_n, Y_n = _synthesize_pi_network_vec(Z_T1, theta_T1, p1)
+        
+        vswr = [
+            _verify_metrics_vec(f, f1, f2, z_l_orig, Z0, aux_line_Z, aux_line_theta, Z1, theta1,
+                                aux_stub_type, aux_stub_Y2, Z_m, stub_type, Y_n)
+            for f, z_l_orig in [(f1, Z_L1), (f2, Z_L2)]
+        ]
+        aux_stub_Z = np.where(aux_stub_Y2 != 0, 1.0 / aux_stub_Y2, 0.0)
+    
+    valid = np.ones(Z1.size, dtype=bool)
+    columns = {
+        "region": region,
+        "Z_aux": aux_line_Z,
+        "theta_aux": np.degrees(aux_line_theta),
+        "Z1": Z1,
+        "theta1": np.degrees(theta1),
+        "Z_series": Z_m,
+        "Z_stub": Z_n,
+        "stub_type": stub_type,
+        "aux_stub_type": aux_stub_type,
+        "aux_stub_Z": aux_stub_Z,
+        "VSWR_f1": vswr[0],
+        "VSWR_f2": vswr[1],
+    }
+    return valid, columns
+
+def _kernel_columns(region, stub_type, aux_stub_type, values):
+    """
+    Column dict from the code arrays and the (9, n) value array of a compiled scan
+    """
+    return {
+        "region": region,
+        "Z_aux": values[0],
+        "theta_aux": values[1],
+        "Z1": values[2],
+        "theta1": values[3],
+        "Z_series": values[4],
+        "Z_stub": values[5],
+        "stub_type": stub_type,
+        "aux_stub_type": aux_stub_type,
+        "aux_stub_Z": values[6],
+        "VSWR_f1": values[7],
+        "VSWR_f2": values[8],
+    }
+
+def _scan_designs_jit(f1, f2, Z_L1, Z_L2, Z0, theta_aux_range, tan_aux_p1, tan_aux_p2, allow_aux_stub):
+    """
+    Numba scan, same return value as _scan_designs_vec
+    """
+    theta_aux_arr = np.asarray(theta_aux_range, dtype=np.float64)
+    valid, region, stub_type, aux_stub_type, values = _kernels._scan(
+        f1, f2, Z_L1, Z_L2, Z0, theta_aux_arr, tan_aux_p1, tan_aux_p2, allow_aux_stub)
+    return valid, _kernel_columns(region, stub_type, aux_stub_type, values)
+
+def _scan_designs_ext(f1, f2, Z_L1, Z_L2, Z0, theta_aux_range, tan_aux_p1, tan_aux_p2, allow_aux_stub):
+    """
+    Cython extension scan, same return value as _scan_designs_vec.
+    The extension evaluates its own aux line trig, find_all_designs passes no tan tables
+    """
+    theta_aux_arr = np.asarray(theta_aux_range, dtype=np.float64)
+    valid, region, stub_type, aux_stub_type, values = _matcher_kernel.scan(
+        f1, f2, Z_L1, Z_L2, Z0, theta_aux_arr, allow_aux_stub)
+    return valid, _kernel_columns(region, stub_type, aux_stub_type, values)
+
+# Lookup tables for the int8 region / stub type codes of all scans
+_REGION_NAMES = np.array(['a', 'b', 'c'], dtype='U1')
+_STUB_NAMES = np.array(['Open', 'Short'], dtype='U5')
+_AUX_STUB_NAMES = np.array(['Open', 'Short', None], dtype=object) # code -1 (no stub) -> None
+
+def find_all_designs(f1, f2, Z_L1, Z_L2, Z0=50.0, allow_aux_stub=True, scan_load_aux_line=True, theta_step=5):
+    """
+    Exhaustive search for valid designs.
+    The load-side aux line is scanned over 0-180 deg in steps of theta_step degrees.
+    Uses the compiled Cython extension when built, else the Numba kernels
+    when available, else the NumPy scan.
+    Returns a dict of typed column arrays holding the valid designs only,
+    ready for pd.DataFrame(results, copy=False).
+    """
+    if theta_step <= 0:
+        raise ValueError(f"theta_step must be positive, got {theta_step}")
     
     # Search space
     if scan_load_aux_line:
-        theta_aux_range = range(0, 180, 5) # Step 5 degrees
+        theta_aux_range = np.arange(0, 180, theta_step)
     else:
-        theta_aux_range = [0]
-        
-    k_range = [0, 1]
+        theta_aux_range = np.array([0])
     
-    for theta_aux in theta_aux_range:
-        for k in k_range:
-            design = DualBandMatchingDesign(f1, f2, Z_L1, Z_L2, Z0)
-            
-            if theta_aux > 0:
-                design.apply_aux_line(50.0, theta_aux)
-            
-            if not design.calculate_conjugate_transform(additional_pi=k):
-                continue
-                
-            design.check_region_and_adjust(allow_aux_stub=allow_aux_stub)
-            
-            if not design.calculate_matching_network():
-                continue
-                
-            design.synthesize_pi_network()
-            
-            params = design.get_design_parameters()
-            metrics = design.verify_metrics()
-            
-            # Add metrics to params
-            params['VSWR_f1'] = metrics[f1]
-            params['VSWR_f2'] = metrics[f2]
-            
-            candidates.append(params)
-            
-    return candidates
+    # The aux line angles are known in advance: evaluate their tan once for the whole grid
+    p1 = f1 / (f1 + f2)
+    p2 = f2 / (f1 + f2)
+    if _matcher_kernel is not None:
+        # The extension evaluates its own aux line trig
+        scan = _scan_designs_ext
+        tan_aux_p1 = tan_aux_p2 = None
+    elif _kernels is not None:
+        scan = _scan_designs_jit
+        # Uniform sweep from 0, stepped by recurrence instead of one tan per angle
+        step_rad = math.radians(theta_step)
+        tan_aux_p1 = _kernels._sweep_tan(theta_aux_range.size, step_rad * p1)
+        tan_aux_p2 = _kernels._sweep_tan(theta_aux_range.size, step_rad * p2)
+    else:
+        scan = _scan_designs_vec
+        theta_aux_rad = np.radians(theta_aux_range)
+        tan_aux_p1 = np.tan(theta_aux_rad * p1)
+        tan_aux_p2 = np.tan(theta_aux_rad * p2)
+    valid, columns = scan(f1, f2, complex(Z_L1), complex(Z_L2), Z0, theta_aux_range,
+                          tan_aux_p1, tan_aux_p2, allow_aux_stub)
+    
+    columns = {"f_design": np.full(valid.shape, f1 + f2), **columns}
+    results = {name: values[valid] for name, values in columns.items()}
+    results["region"] = _REGION_NAMES[results["region"]]
+    results["stub_type"] = _STUB_NAMES[results["stub_type"]]
+    results["aux_stub_type"] = _AUX_STUB_NAMES[results["aux_stub_type"]]
+    return results
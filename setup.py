@@ -0,0 +1,26 @@
+# Optional ahead-of-time build of the design kernel:
+#   pip install cython
+#   python setup.py build_ext --inplace
+# core.matcher picks up core/_matcher_kernel*.so automatically and otherwise
+# falls back to the Numba / NumPy scans.
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # Cython is optional, install without the extension
+    cythonize = None
+
+extensions = [
+    Extension(
+        "core._matcher_kernel",
+        ["core/_matcher_kernel.pyx"],
+        extra_compile_args=["-O3", "-ffast-math"],
+    )
+]
+
+setup(
+    name="dual_band_matcher",
+    packages=["core"],
+    ext_modules=cythonize(extensions) if cythonize is not None else [],
+)
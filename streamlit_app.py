@@ -4,6 +4,11 @@ import numpy as np
 import sys
 import os
 
+# Streamlit runs the script in a worker thread, and with Numba's default TBB
+# threading layer the parallel scan then hangs interpreter exit. Prefer OpenMP
+# for this app unless the environment already picks a layer
+os.environ.setdefault("NUMBA_THREADING_LAYER_PRIORITY", "omp tbb workqueue")
+
 # Import core logic
 # Since this file is now in the root, we can import directly from core
 import core.matcher
@@ -11,6 +16,14 @@ from core.matcher import find_all_designs
 
 st.set_page_config(page_title="Dual Band Matching Design", layout="wide")
 
+@st.cache_data(show_spinner=False)
+def _cached_find_all_designs(f1, f2, r1, x1, r2, x2, Z0, allow_aux_stub, scan_load_aux, theta_step):
+    # The scan is deterministic in its inputs, reruns that only change filters hit the cache.
+    # Loads are passed as floats and made complex here to keep the cache key hashable
+    return find_all_designs(f1, f2, complex(r1, x1), complex(r2, x2), Z0,
+                            allow_aux_stub=allow_aux_stub, scan_load_aux_line=scan_load_aux,
+                            theta_step=theta_step)
+
 st.title("Dual Band Matching Network Designer")
 st.markdown("Based on Pi-Network Synthesis and Conjugate Matching")
 
@@ -37,34 +50,34 @@ max_zn = st.sidebar.slider("Max Parallel Stub Impedance (Zn)", 50, 200, 105)
 st.sidebar.markdown("---")
 st.sidebar.markdown("**Auxiliary Elements**")
 scan_load_aux = st.sidebar.checkbox("Enable Load-Side Aux Line Scan", value=True, help="Scans 0-180° for the auxiliary line at the load to satisfy Eq 3-10. If disabled, length is fixed to 0°.")
+theta_step = st.sidebar.slider("Scan resolution (deg)", 1, 10, 5, help="Step of the load-side aux line scan. Smaller steps evaluate more candidates.", disabled=not scan_load_aux)
 allow_aux_stub = st.sidebar.checkbox("Enable Case [c] Stub (at TL1 Input)", value=True, help="Controls the parallel stub added between TL1 and Pi-Network to handle Region [c] (R<=1, G<=1). This is NOT the auxiliary line at the load.")
 
 if st.sidebar.button("Calculate Designs"):
     f1 = f1_ghz * 1e9
     f2 = f2_ghz * 1e9
-    Z_L1 = complex(r1, x1)
-    Z_L2 = complex(r2, x2)
     
     with st.spinner("Optimizing and searching for valid designs..."):
-        results = find_all_designs(f1, f2, Z_L1, Z_L2, Z0, allow_aux_stub=allow_aux_stub, scan_load_aux_line=scan_load_aux)
+        results = _cached_find_all_designs(f1, f2, r1, x1, r2, x2, Z0, allow_aux_stub, scan_load_aux, theta_step)
+    
+    # results is a dict of column arrays holding the valid designs only
+    df = pd.DataFrame(results, copy=False)
     
-    if not results:
+    if df.empty:
         st.error("No valid designs found for these parameters.")
     else:
-        df = pd.DataFrame(results)
-        
         # Filter
-        valid_df = df[df['Z_stub'] <= max_zn].copy()
+        valid_df = df[df['Z_stub'] <= max_zn]
         
         st.subheader(f"Found {len(df)} total designs, {len(valid_df)} meet constraints.")
         
         if not valid_df.empty:
             # Sort by closeness to 50 Ohm for Z_stub (manufacturability) or just show all
-            valid_df['Delta_50'] = abs(valid_df['Z_stub'] - 50)
-            valid_df = valid_df.sort_values('Delta_50')
-            
             # Convert f_design to GHz for display
-            valid_df['f_design'] = valid_df['f_design'] / 1e9
+            valid_df = valid_df.assign(
+                Delta_50=abs(valid_df['Z_stub'] - 50),
+                f_design=valid_df['f_design'] / 1e9,
+            ).sort_values('Delta_50')
             
             # Define columns to format
             numeric_cols = ['f_design', 'Z_aux', 'theta_aux', 'Z1', 'theta1', 
@@ -77,11 +90,13 @@ if st.sidebar.button("Calculate Designs"):
             valid_df = valid_df[cols_order]
 
             # Apply formatting only to existing numeric columns
-            format_dict = {col: "{:.2f}" for col in numeric_cols if col in valid_df.columns}
-            if 'VSWR_f1' in format_dict: format_dict['VSWR_f1'] = "{:.4f}"
-            if 'VSWR_f2' in format_dict: format_dict['VSWR_f2'] = "{:.4f}"
+            format_dict = {col: "%.2f" for col in numeric_cols if col in valid_df.columns}
+            if 'VSWR_f1' in format_dict: format_dict['VSWR_f1'] = "%.4f"
+            if 'VSWR_f2' in format_dict: format_dict['VSWR_f2'] = "%.4f"
             
-            st.dataframe(valid_df.style.format(format_dict))
+            # Formatted by the frontend, the columns stay numeric and sort as numbers
+            column_config = {col: st.column_config.NumberColumn(format=fmt) for col, fmt in format_dict.items()}
+            st.dataframe(valid_df, column_config=column_config)
             
             best = valid_df.iloc[0]
             st.success(f"Recommended Design: Zn = {best['Z_stub']:.2f} Ohm (Region: {best['region']})")
@@ -136,8 +151,9 @@ if st.sidebar.button("Calculate Designs"):
                            'Z_series', 'Z_stub', 'aux_stub_Z', 'VSWR_f1', 'VSWR_f2']
             
             # Apply formatting only to existing numeric columns
-            format_dict = {col: "{:.2f}" for col in numeric_cols if col in df.columns}
-            if 'VSWR_f1' in format_dict: format_dict['VSWR_f1'] = "{:.4f}"
-            if 'VSWR_f2' in format_dict: format_dict['VSWR_f2'] = "{:.4f}"
+            format_dict = {col: "%.2f" for col in numeric_cols if col in df.columns}
+            if 'VSWR_f1' in format_dict: format_dict['VSWR_f1'] = "%.4f"
+            if 'VSWR_f2' in format_dict: format_dict['VSWR_f2'] = "%.4f"
             
-            st.dataframe(df.style.format(format_dict))
+            column_config = {col: st.column_config.NumberColumn(format=fmt) for col, fmt in format_dict.items()}
+            st.dataframe(df, column_config=column_config)
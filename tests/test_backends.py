@@ -0,0 +1,122 @@
+"""
+find_all_designs has several scan backends (NumPy, Numba, Cython) that each
+re-implement the DualBandMatchingDesign pipeline. Every available backend is
+checked against the per-candidate class loop on fixed loads.
+
+Run from the repository root: python -m unittest discover -s tests
+"""
+import importlib
+import itertools
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from core import matcher
+from core.matcher import DualBandMatchingDesign, find_all_designs
+
+# (f1, f2, Z_L1, Z_L2), the first one is the streamlit_app default
+LOADS = [
+    (0.9e9, 1.2e9, complex(22.4, 16.3), complex(26.2, 20.3)),
+    (1.2e9, 1.8e9, complex(30, 10), complex(20, -15)),
+    (2.4e9, 5.8e9, complex(12, 5), complex(18, -9)),
+]
+
+NUMERIC_COLUMNS = ['f_design', 'Z_aux', 'theta_aux', 'Z1', 'theta1', 'Z_series', 'Z_stub',
+                   'aux_stub_Z', 'VSWR_f1', 'VSWR_f2']
+CODE_COLUMNS = ['region', 'stub_type', 'aux_stub_type']
+
+
+def reference_designs(f1, f2, Z_L1, Z_L2, Z0=50.0, allow_aux_stub=True, scan_load_aux_line=True, theta_step=5):
+    """
+    One DualBandMatchingDesign per (theta_aux, k) candidate, as find_all_designs did originally
+    """
+    candidates = []
+    theta_aux_range = range(0, 180, theta_step) if scan_load_aux_line else [0]
+    for theta_aux in theta_aux_range:
+        for k in [0, 1]:
+            design = DualBandMatchingDesign(f1, f2, Z_L1, Z_L2, Z0)
+            if theta_aux > 0:
+                design.apply_aux_line(50.0, theta_aux)
+            if not design.calculate_conjugate_transform(additional_pi=k):
+                continue
+            design.check_region_and_adjust(allow_aux_stub=allow_aux_stub)
+            if not design.calculate_matching_network():
+                continue
+            design.synthesize_pi_network()
+            params = design.get_design_parameters()
+            metrics = design.verify_metrics()
+            params['VSWR_f1'] = metrics[f1]
+            params['VSWR_f2'] = metrics[f2]
+            candidates.append(params)
+    return candidates
+
+
+def _optional_module(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Backend name -> (_matcher_kernel, _kernels) module attributes selecting it in find_all_designs
+_KERNELS = _optional_module('core._kernels')
+_EXTENSION = _optional_module('core._matcher_kernel')
+BACKENDS = {'numpy': (None, None)}
+if _KERNELS is not None:
+    BACKENDS['numba'] = (None, _KERNELS)
+if _EXTENSION is not None:
+    BACKENDS['cython'] = (_EXTENSION, None)
+
+
+class BackendAgreementTest(unittest.TestCase):
+
+    def assert_matches_reference(self, backend, loads, **kwargs):
+        expected = reference_designs(*loads, **kwargs)
+        extension, kernels = BACKENDS[backend]
+        with mock.patch.object(matcher, '_matcher_kernel', extension), \
+                mock.patch.object(matcher, '_kernels', kernels):
+            results = find_all_designs(*loads, **kwargs)
+
+        self.assertEqual(len(results['Z1']), len(expected))
+        for col in CODE_COLUMNS:
+            self.assertEqual(list(results[col]), [row[col] for row in expected], col)
+        for col in NUMERIC_COLUMNS:
+            np.testing.assert_allclose(results[col], [row[col] for row in expected],
+                                       rtol=1e-7, atol=1e-9, err_msg=col)
+
+    def test_backends_match_class_loop(self):
+        for backend, loads, allow_aux_stub, scan_load_aux_line in itertools.product(
+                BACKENDS, LOADS, [True, False], [True, False]):
+            with self.subTest(backend=backend, loads=loads, allow_aux_stub=allow_aux_stub,
+                              scan_load_aux_line=scan_load_aux_line):
+                self.assert_matches_reference(backend, loads, allow_aux_stub=allow_aux_stub,
+                                              scan_load_aux_line=scan_load_aux_line)
+
+    def test_backends_match_class_loop_fine_step(self):
+        for backend in BACKENDS:
+            with self.subTest(backend=backend):
+                self.assert_matches_reference(backend, LOADS[0], theta_step=1)
+
+    def test_backends_match_class_loop_equal_frequencies(self):
+        # f1 == f2 puts the stubs at a quarter wave, divisions by zero must give inf / nan, not abort a scan
+        loads = (1e9, 1e9) + LOADS[0][2:]
+        for backend in BACKENDS:
+            with self.subTest(backend=backend), np.errstate(divide='ignore'):
+                self.assert_matches_reference(backend, loads)
+                # A failed parallel Numba worker used to poison the next call as well
+                self.assert_matches_reference(backend, loads)
+
+    def test_rejects_non_positive_theta_step(self):
+        for theta_step in [0, -5]:
+            with self.subTest(theta_step=theta_step), self.assertRaises(ValueError):
+                find_all_designs(*LOADS[0], theta_step=theta_step)
+
+    def test_scan_finds_aux_stub_designs(self):
+        # Keeps the Case [c] stub path covered by the comparisons above
+        results = find_all_designs(*LOADS[2])
+        self.assertTrue(any(t is not None for t in results['aux_stub_type']))
+
+
+if __name__ == '__main__':
+    unittest.main()